@@ -13,57 +13,115 @@ The tests focus on:
 4. Dust protection threshold validation
 """
 
+import argparse
+import functools
+import io
+import math
 import sys
-from datetime import datetime
+import time
 
-def print_header(title):
-    print("\n" + "=" * 80)
-    print(f"🦑 {title}")
-    print("=" * 80)
+# Simulated voter data that would be tested
+_TEST_VOTERS = (
+    ("0x5abC63ebF1950d531408cf8E12cE24c047504847", "Voter with raw SQUID only"),
+    ("0xb19d6b66b18fae0fca1023138b229e5f970b5180", "Voter with SQUID + LP tokens"),
+    ("0x6c46f3f23ed4a070da8d7c1af302d09394efb79f", "Voter with complex portfolio"),
+)
 
-def print_vulnerability_alert(vulnerability_name, description):
-    print(f"\n🚨 CRITICAL VULNERABILITY DETECTED: {vulnerability_name}")
-    print("─" * 60)
-    print(description)
-    print("─" * 60)
+_CENSUS_TESTS = (
+    ("Balance Functionality", "Core balance retrieval works"),
+    ("Balance Ordering", "Voters sorted by voting power correctly"),
+    ("LP Equivalency", "Price calculations consistent"),
+    ("Price Consistency", "Oracle data validation"),
+    ("Voter Diversity", "Multiple token types handled"),
+)
 
-def print_test_result(test_name, status, details=""):
-    status_emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
-    print(f"{status_emoji} {test_name}: {status}")
+_EDGE_CASES = (
+    (0, "Zero quantity", "Should return 0"),
+    (10**6, "Micro amount", "Dust protection check"),
+    (10**18, "Standard amount", "Normal calculation"),
+    (10**24, "Large amount", "Overflow protection"),
+    (10**27, "Maximum amount", "Extreme value handling"),
+)
+
+def _classify_edge_case(quantity):
+    if quantity == 0:
+        return "✅ Returns 0"
+    elif quantity < 10_000_000:
+        return "✅ Dust protected"
+    elif quantity >= 10**24:
+        return "✅ No overflow"
+    else:
+        return "✅ Normal calc"
+
+# The edge case inputs are constants, so the rendered table is built once at import
+_EDGE_CASE_TABLE = "\n".join(
+    f"{quantity:<15,} {description:<20} {expected:<20} {_classify_edge_case(quantity)}"
+    for quantity, description, expected in _EDGE_CASES
+)
+
+# Dividers used throughout the report
+_EQ80 = "=" * 80
+_DASH60 = "─" * 60
+_DASH80 = "-" * 80
+_INFO20 = "ℹ️ " * 20
+
+_STATUS_EMOJI = {"PASS": "✅", "FAIL": "❌"}
+
+# Row layout shared by both dust attack tables
+_DUST_ROW_FMT = "{amount:<15,} {squid:<20} {squill:<20} {mark}".format
+
+@functools.lru_cache(maxsize=32)
+def _fmt_rate(rate):
+    return f"{rate:.4f}"
+
+def print_header(title, out=None):
+    print("\n" + _EQ80, file=out)
+    print(f"🦑 {title}", file=out)
+    print(_EQ80, file=out)
+
+def print_vulnerability_alert(vulnerability_name, description, out=None):
+    print(f"\n🚨 CRITICAL VULNERABILITY DETECTED: {vulnerability_name}", file=out)
+    print(_DASH60, file=out)
+    print(description, file=out)
+    print(_DASH60, file=out)
+
+def print_test_result(test_name, status, details="", out=None):
+    status_emoji = _STATUS_EMOJI.get(status, "⚠️")
+    print(f"{status_emoji} {test_name}: {status}", file=out)
     if details:
-        print(f"   {details}")
+        print(f"   {details}", file=out)
 
-def demonstrate_dust_attack_poc():
+def demonstrate_dust_attack_poc(out):
     """
     POC #1: Dust Attack Vulnerability Test
     
     This POC demonstrates how the test would identify a critical vulnerability
     where small amounts (dust) of LP tokens could be exploited for outsized voting power.
     """
-    print_header("POC #1: DUST ATTACK VULNERABILITY TEST")
+    print_header("POC #1: DUST ATTACK VULNERABILITY TEST", out=out)
     
-    print("\n📋 Test Scenario:")
-    print("- Testing LP equivalent calculations for dust amounts (1 wei to 10M wei)")
-    print("- Checking if dust protection threshold (10M wei) is enforced")
-    print("- Verifying rate consistency across different input amounts")
+    print("\n📋 Test Scenario:", file=out)
+    print("- Testing LP equivalent calculations for dust amounts (1 wei to 10M wei)", file=out)
+    print("- Checking if dust protection threshold (10M wei) is enforced", file=out)
+    print("- Verifying rate consistency across different input amounts", file=out)
     
     # Simulate what the actual test would find
-    print("\n🔍 Simulated Test Execution:")
+    print("\n🔍 Simulated Test Execution:", file=out)
     
     # Standard rates (what would be found with 1 full LP token)
     squid_lp_standard_rate = 12.6445  # SQUID per LP
     squill_lp_standard_rate = 12.6445  # SQUID per LP (hypothetical)
     
-    print(f"\nStandard rates (1 full LP token = 10^18 wei):")
-    print(f"  SQUID/ETH LP: {squid_lp_standard_rate:.4f} SQUID per LP")
-    print(f"  SQUID/SQUILL LP: {squill_lp_standard_rate:.4f} SQUID per LP")
+    print(f"\nStandard rates (1 full LP token = 10^18 wei):", file=out)
+    print(f"  SQUID/ETH LP: {_fmt_rate(squid_lp_standard_rate)} SQUID per LP", file=out)
+    print(f"  SQUID/SQUILL LP: {_fmt_rate(squill_lp_standard_rate)} SQUID per LP", file=out)
     
     # Test dust amounts
     dust_amounts = [1, 100, 1000, 1_000_000, 5_000_000, 9_999_999]
     
-    print(f"\n📊 Testing dust amounts (below 10M wei threshold):")
-    print(f"{'Amount (wei)':<15} {'SQUID LP Status':<20} {'SQUILL LP Status':<20} {'Result'}")
-    print("-" * 80)
+    print(f"\n📊 Testing dust amounts (below 10M wei threshold):", file=out)
+    print(f"{'Amount (wei)':<15} {'SQUID LP Status':<20} {'SQUILL LP Status':<20} {'Result'}", file=out)
+    print(_DASH80, file=out)
     
     vulnerability_found = False
     
@@ -85,213 +143,201 @@ def demonstrate_dust_attack_poc():
                 f"Expected: ~0 SQUID (dust protection should apply)\n"
                 f"Actual: {voting_power:,} SQUID (400,000x inflation!)\n\n"
                 f"IMPACT: Users acquiring dust amounts of SQUILL LP could gain outsized voting power.\n"
-                f"RECOMMENDATION: Enforce minimum LP amounts or add dust protection checks."
+                f"RECOMMENDATION: Enforce minimum LP amounts or add dust protection checks.",
+                out=out,
             )
         else:
             squill_status = "✓ PROTECTED"
         
-        print(f"{amount:<15,} {squid_status:<20} {squill_status:<20} {'❌' if amount == 1 else '✓'}")
+        print(_DUST_ROW_FMT(amount=amount, squid=squid_status, squill=squill_status, mark='❌' if amount == 1 else '✓'), file=out)
     
-    print("\n📈 Testing amounts above 10M wei threshold:")
+    print("\n📈 Testing amounts above 10M wei threshold:", file=out)
     above_threshold = [10_000_000, 10_000_001, 10**18]
     
-    for amount in above_threshold:
-        squid_status = f"✓ RATE: {squid_lp_standard_rate:.4f}"
-        squill_status = f"✓ RATE: {squill_lp_standard_rate:.4f}" 
-        print(f"{amount:<15,} {squid_status:<20} {squill_status:<20} ✓")
+    squid_status = f"✓ RATE: {_fmt_rate(squid_lp_standard_rate)}"
+    squill_status = f"✓ RATE: {_fmt_rate(squill_lp_standard_rate)}"
+    out.writelines(
+        _DUST_ROW_FMT(amount=amount, squid=squid_status, squill=squill_status, mark="✓") + "\n"
+        for amount in above_threshold
+    )
     
     return vulnerability_found
 
-def demonstrate_balance_calculation_poc():
+def demonstrate_balance_calculation_poc(out):
     """
     POC #2: Balance Calculation Accuracy Test
     
     This POC demonstrates testing of the core balance calculation logic
     for accuracy and consistency across different scenarios.
     """
-    print_header("POC #2: BALANCE CALCULATION ACCURACY TEST")
-    
-    print("\n📋 Test Scenario:")
-    print("- Testing balance calculations for various voter addresses")
-    print("- Verifying component calculations (raw SQUID + LP equivalents)")
-    print("- Checking for rounding errors and calculation mismatches")
-    
-    print("\n🔍 Simulated Test Execution:")
-    
-    # Simulate voter data that would be tested
-    test_voters = [
-        ("0x5abC63ebF1950d531408cf8E12cE24c047504847", "Voter with raw SQUID only"),
-        ("0xb19d6b66b18fae0fca1023138b229e5f970b5180", "Voter with SQUID + LP tokens"),
-        ("0x6c46f3f23ed4a070da8d7c1af302d09394efb79f", "Voter with complex portfolio"),
-    ]
-    
-    print(f"\n📊 Balance Calculation Verification:")
-    print(f"{'Voter Address':<45} {'Status':<15} {'Result'}")
-    print("-" * 80)
-    
-    for addr, description in test_voters:
-        # Simulate balance calculation verification
-        raw_squid = 1000 * 10**18  # 1000 SQUID
-        squid_lp_balance = 0.5 * 10**18  # 0.5 LP tokens
-        squill_lp_balance = 0.3 * 10**18  # 0.3 LP tokens
-        
-        # Calculate expected vs actual (simulated)
-        expected_total = raw_squid + (squid_lp_balance * 12.6445) + (squill_lp_balance * 12.6445)
-        actual_total = expected_total  # Assuming calculations are correct
-        
-        difference = abs(actual_total - expected_total)
-        status = "✅ ACCURATE" if difference <= 1 else "❌ MISMATCH"
-        
-        print(f"{addr:<45} {status:<15} {description}")
+    print_header("POC #2: BALANCE CALCULATION ACCURACY TEST", out=out)
+    
+    print("\n📋 Test Scenario:", file=out)
+    print("- Testing balance calculations for various voter addresses", file=out)
+    print("- Verifying component calculations (raw SQUID + LP equivalents)", file=out)
+    print("- Checking for rounding errors and calculation mismatches", file=out)
+    
+    print("\n🔍 Simulated Test Execution:", file=out)
+    
+    print(f"\n📊 Balance Calculation Verification:", file=out)
+    print(f"{'Voter Address':<45} {'Status':<15} {'Result'}", file=out)
+    print(_DASH80, file=out)
+    
+    # Simulated portfolio, identical for every voter, so it is verified once
+    raw_squid = 1000 * 10**18  # 1000 SQUID
+    squid_lp_balance = 0.5 * 10**18  # 0.5 LP tokens
+    squill_lp_balance = 0.3 * 10**18  # 0.3 LP tokens
+    
+    # Calculate expected vs actual (simulated)
+    expected_total = raw_squid + (squid_lp_balance * 12.6445) + (squill_lp_balance * 12.6445)
+    actual_total = expected_total  # Assuming calculations are correct
     
-    print("\n✅ All balance calculations verified for accuracy")
+    status = "✅ ACCURATE" if math.isclose(actual_total, expected_total, rel_tol=0, abs_tol=1) else "❌ MISMATCH"
+    
+    out.writelines(f"{addr:<45} {status:<15} {description}\n" for addr, description in _TEST_VOTERS)
+    
+    print("\n✅ All balance calculations verified for accuracy", file=out)
     return True
 
-def demonstrate_lp_equivalent_edge_cases():
+def demonstrate_lp_equivalent_edge_cases(out):
     """
     POC #3: LP Equivalent Edge Cases Test
     
     This POC demonstrates testing of edge cases in LP equivalent calculations
     including zero values, maximum values, and consistency checks.
     """
-    print_header("POC #3: LP EQUIVALENT EDGE CASES TEST")
-    
-    print("\n📋 Test Scenario:")
-    print("- Testing LP equivalent functions with edge case inputs")
-    print("- Zero quantity handling")
-    print("- Maximum value overflow protection")
-    print("- Rate consistency verification")
-    
-    print("\n🔍 Simulated Test Execution:")
-    
-    edge_cases = [
-        (0, "Zero quantity", "Should return 0"),
-        (10**6, "Micro amount", "Dust protection check"),
-        (10**18, "Standard amount", "Normal calculation"), 
-        (10**24, "Large amount", "Overflow protection"),
-        (10**27, "Maximum amount", "Extreme value handling")
-    ]
-    
-    print(f"\n📊 Edge Case Testing:")
-    print(f"{'Quantity':<15} {'Description':<20} {'Expected':<20} {'Result'}")
-    print("-" * 80)
-    
-    for quantity, description, expected in edge_cases:
-        if quantity == 0:
-            result = "✅ Returns 0"
-        elif quantity < 10_000_000:
-            result = "✅ Dust protected"
-        elif quantity >= 10**24:
-            result = "✅ No overflow"
-        else:
-            result = "✅ Normal calc"
-            
-        print(f"{quantity:<15,} {description:<20} {expected:<20} {result}")
+    print_header("POC #3: LP EQUIVALENT EDGE CASES TEST", out=out)
+    
+    print("\n📋 Test Scenario:", file=out)
+    print("- Testing LP equivalent functions with edge case inputs", file=out)
+    print("- Zero quantity handling", file=out)
+    print("- Maximum value overflow protection", file=out)
+    print("- Rate consistency verification", file=out)
     
-    print("\n✅ All edge cases handled correctly")
+    print("\n🔍 Simulated Test Execution:", file=out)
+    
+    print(f"\n📊 Edge Case Testing:", file=out)
+    print(f"{'Quantity':<15} {'Description':<20} {'Expected':<20} {'Result'}", file=out)
+    print(_DASH80, file=out)
+    print(_EDGE_CASE_TABLE, file=out)
+    
+    print("\n✅ All edge cases handled correctly", file=out)
     return True
 
-def demonstrate_census_functionality_poc():
+def demonstrate_census_functionality_poc(out):
     """
     POC #4: Census Functionality Test
     
     This POC demonstrates testing of the census/voter aggregation functionality
     for consistency and correctness.
     """
-    print_header("POC #4: CENSUS FUNCTIONALITY TEST")
+    print_header("POC #4: CENSUS FUNCTIONALITY TEST", out=out)
     
-    print("\n📋 Test Scenario:")
-    print("- Testing census balance ordering and consistency")
-    print("- Verifying voter diversity handling")
-    print("- Checking price oracle integration")
+    print("\n📋 Test Scenario:", file=out)
+    print("- Testing census balance ordering and consistency", file=out)
+    print("- Verifying voter diversity handling", file=out)
+    print("- Checking price oracle integration", file=out)
     
-    print("\n🔍 Simulated Test Execution:")
+    print("\n🔍 Simulated Test Execution:", file=out)
     
-    census_tests = [
-        ("Balance Functionality", "Core balance retrieval works"),
-        ("Balance Ordering", "Voters sorted by voting power correctly"),
-        ("LP Equivalency", "Price calculations consistent"),
-        ("Price Consistency", "Oracle data validation"),
-        ("Voter Diversity", "Multiple token types handled")
-    ]
+    print(f"\n📊 Census Function Testing:", file=out)
+    print(f"{'Test Category':<25} {'Description':<35} {'Result'}", file=out)
+    print(_DASH80, file=out)
     
-    print(f"\n📊 Census Function Testing:")
-    print(f"{'Test Category':<25} {'Description':<35} {'Result'}")
-    print("-" * 80)
+    out.writelines(f"{test_name:<25} {description:<35} {'✅ PASS'}\n" for test_name, description in _CENSUS_TESTS)
     
-    for test_name, description in census_tests:
-        print(f"{test_name:<25} {description:<35} {'✅ PASS'}")
-    
-    print("\n✅ All census functionality tests passed")
+    print("\n✅ All census functionality tests passed", file=out)
     return True
 
-def main():
+# (CLI key, name, demo, whether a truthy result means a vulnerability was found)
+POCS = [
+    ("dust", "Dust Attack Vulnerability", demonstrate_dust_attack_poc, True),
+    ("balance", "Balance Calculation Accuracy", demonstrate_balance_calculation_poc, False),
+    ("edge", "LP Equivalent Edge Cases", demonstrate_lp_equivalent_edge_cases, False),
+    ("census", "Census Functionality", demonstrate_census_functionality_poc, False),
+]
+
+def parse_args(argv=None):
+    poc_keys = [key for key, _, _, _ in POCS]
+    parser = argparse.ArgumentParser(description="Security audit POC demonstration")
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--only", nargs="+", choices=poc_keys, default=poc_keys,
+        help="run only the selected POCs",
+    )
+    selection.add_argument(
+        "--fast", action="store_true",
+        help="run only the critical dust attack POC (same as --only dust)",
+    )
+    args = parser.parse_args(argv)
+    if args.fast:
+        args.only = ["dust"]
+    return args
+
+def main(argv=None):
     """
     Main POC demonstration function
+
+    All output is buffered and written to stdout in a single call at the end.
     """
-    print_header("SQUID DAO VOTE CALCULATOR - SECURITY AUDIT POC DEMONSTRATION")
+    args = parse_args(argv)
+    out = io.StringIO()
+
+    print_header("SQUID DAO VOTE CALCULATOR - SECURITY AUDIT POC DEMONSTRATION", out=out)
     
-    print(f"\n🕐 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print("🔍 Environment: Sandbox (Network access limited)")
-    print("📋 Purpose: Demonstrate security audit POCs without external dependencies")
+    print(f"\n🕐 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}", file=out)
+    print("🔍 Environment: Sandbox (Network access limited)", file=out)
+    print("📋 Purpose: Demonstrate security audit POCs without external dependencies", file=out)
     
-    print("\n" + "ℹ️ " * 20)
-    print("ℹ️  IMPORTANT NOTE:")
-    print("ℹ️  These are simulated demonstrations of the actual POCs.")
-    print("ℹ️  Real execution requires Fraxtal network access for fork testing.")
-    print("ℹ️  The actual tests would interact with deployed contracts and live data.")
-    print("ℹ️ " * 20)
+    print("\n" + _INFO20, file=out)
+    print("ℹ️  IMPORTANT NOTE:", file=out)
+    print("ℹ️  These are simulated demonstrations of the actual POCs.", file=out)
+    print("ℹ️  Real execution requires Fraxtal network access for fork testing.", file=out)
+    print("ℹ️  The actual tests would interact with deployed contracts and live data.", file=out)
+    print(_INFO20, file=out)
     
     # Execute all POC demonstrations
     poc_results = []
     
-    print("\n🎯 Executing Security Audit POCs...")
-    
-    # POC 1: Critical dust attack vulnerability
-    vulnerability_found = demonstrate_dust_attack_poc()
-    poc_results.append(("Dust Attack Vulnerability", vulnerability_found, "CRITICAL" if vulnerability_found else "PASS"))
+    print("\n🎯 Executing Security Audit POCs...", file=out)
     
-    # POC 2: Balance calculation accuracy
-    balance_accurate = demonstrate_balance_calculation_poc()
-    poc_results.append(("Balance Calculation Accuracy", balance_accurate, "PASS"))
-    
-    # POC 3: LP equivalent edge cases
-    edge_cases_pass = demonstrate_lp_equivalent_edge_cases()
-    poc_results.append(("LP Equivalent Edge Cases", edge_cases_pass, "PASS"))
-    
-    # POC 4: Census functionality
-    census_pass = demonstrate_census_functionality_poc()
-    poc_results.append(("Census Functionality", census_pass, "PASS"))
+    for key, poc_name, demonstrate, reports_vulnerability in POCS:
+        if key not in args.only:
+            continue
+        result = demonstrate(out)
+        severity = "CRITICAL" if reports_vulnerability and result else "PASS"
+        poc_results.append((poc_name, result, severity))
     
     # Summary
-    print_header("POC EXECUTION SUMMARY")
+    print_header("POC EXECUTION SUMMARY", out=out)
     
-    print(f"\n📊 Results Summary:")
-    print(f"{'POC Name':<30} {'Executed':<10} {'Severity':<10} {'Status'}")
-    print("-" * 80)
+    print(f"\n📊 Results Summary:", file=out)
+    print(f"{'POC Name':<30} {'Executed':<10} {'Severity':<10} {'Status'}", file=out)
+    print(_DASH80, file=out)
     
-    critical_found = False
-    for poc_name, executed, severity in poc_results:
-        status_emoji = "🚨" if severity == "CRITICAL" else "✅"
-        print(f"{poc_name:<30} {'✅ YES':<10} {severity:<10} {status_emoji}")
-        if severity == "CRITICAL":
-            critical_found = True
+    out.writelines(
+        f"{poc_name:<30} {'✅ YES':<10} {severity:<10} {'🚨' if severity == 'CRITICAL' else '✅'}\n"
+        for poc_name, executed, severity in poc_results
+    )
+    critical_found = any(severity == "CRITICAL" for _, _, severity in poc_results)
     
-    print(f"\n🎯 Total POCs Executed: {len(poc_results)}")
-    print(f"🚨 Critical Vulnerabilities Found: {'1 (Dust Attack)' if critical_found else '0'}")
-    print(f"✅ Tests Passed: {len([r for r in poc_results if r[2] == 'PASS'])}")
+    print(f"\n🎯 Total POCs Executed: {len(poc_results)}", file=out)
+    print(f"🚨 Critical Vulnerabilities Found: {'1 (Dust Attack)' if critical_found else '0'}", file=out)
+    print(f"✅ Tests Passed: {len([r for r in poc_results if r[2] == 'PASS'])}", file=out)
     
     if critical_found:
-        print("\n🚨 CRITICAL SECURITY ALERT:")
-        print("   A dust attack vulnerability was identified in SQUILL LP handling.")
-        print("   This requires immediate attention and remediation.")
-        print("   See detailed findings in POC #1 above.")
-    
-    print_header("POC DEMONSTRATION COMPLETE")
-    print("✅ All planned security audit POCs have been demonstrated.")
-    print("📸 Screenshots and detailed logs available above.")
-    print("🔒 Recommend addressing any critical findings before production deployment.")
-    
+        print("\n🚨 CRITICAL SECURITY ALERT:", file=out)
+        print("   A dust attack vulnerability was identified in SQUILL LP handling.", file=out)
+        print("   This requires immediate attention and remediation.", file=out)
+        print("   See detailed findings in POC #1 above.", file=out)
+    
+    print_header("POC DEMONSTRATION COMPLETE", out=out)
+    print("✅ All planned security audit POCs have been demonstrated.", file=out)
+    print("📸 Screenshots and detailed logs available above.", file=out)
+    print("🔒 Recommend addressing any critical findings before production deployment.", file=out)
+    
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
     return 0 if not critical_found else 1
 
 if __name__ == "__main__":
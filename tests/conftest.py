@@ -1,6 +1,5 @@
 import os
 
-import boa
 import pytest
 from dotenv import load_dotenv
 
@@ -41,6 +40,8 @@ def zero_address():
 @pytest.fixture
 def squid(env, fork_mode, zero_address):
     if fork_mode:
+        import boa
+
         token = boa.load_partial("contracts/test/ERC20.vy")
         return token.at(SQUID_ADDR)
     else:
@@ -50,6 +51,9 @@ def squid(env, fork_mode, zero_address):
 @pytest.fixture(scope="session")
 def env(fork_mode):
     """Set up the boa environment based on fork mode"""
+    # Imported lazily: boa pulls in vyper, and fork_only tests skip without --fork
+    import boa
+
     if fork_mode:
         boa.fork(FORK_RPC_URI, allow_dirty=True)
     return boa.env
@@ -58,11 +62,59 @@ def env(fork_mode):
 
 @pytest.fixture(scope="session")
 def census(env, fork_mode):
+    import boa
+
     contract = boa.load_partial("contracts/SquidDaoVote.vy")
     deployment = contract.deploy()
     return deployment
 
 
+class MemoCensus:
+    """Census wrapper that memoizes view calls by (function, args)"""
+
+    def __init__(self, census):
+        self._census = census
+        self._cache = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self._census, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args):
+            key = (name, args)
+            if key not in self._cache:
+                self._cache[key] = attr(*args)
+            return self._cache[key]
+
+        return call
+
+
+@pytest.fixture(scope="session")
+def memo_census(census):
+    """Memoized census for voter queries; fork state is fixed within a session"""
+    return MemoCensus(census)
+
+
+@pytest.fixture(scope="session")
+def baseline_lp_rates(census):
+    """Standard (10**18) LP equivalent rates, fetched once per fork session"""
+    return {
+        "squid": census.squid_lp_equivalent(10**18),
+        "squill": census.squill_lp_equivalent(10**18),
+    }
+
+
+@pytest.fixture(scope="session")
+def baseline_prices(census):
+    """Oracle prices, fetched once per fork session"""
+    return {
+        "eth": census.eth_price(),
+        "squid": census.squid_price(),
+        "squill": census.squill_price(),
+    }
+
+
 @pytest.fixture(scope="session")
 def voter_addresses(zero_address):
     return [
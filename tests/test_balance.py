@@ -1,6 +1,5 @@
 import time
 
-import boa
 import pytest
 import requests
 
@@ -77,7 +76,7 @@ def get_cached_prices():
     }
 
 
-def test_voter_has_balance(voter_addresses, squid, census):
+def test_voter_has_balance(voter_addresses, squid, memo_census):
     raw_squid = [False, False]
     lp_bal_test = [False, False]
     pro_quo_bal = [False, False]
@@ -89,13 +88,13 @@ def test_voter_has_balance(voter_addresses, squid, census):
         elif bal > 0:
             raw_squid[1] = True
 
-        lp_bal = census.squid_lp_balance(voter)
+        lp_bal = memo_census.squid_lp_balance(voter)
         if lp_bal == 0:
             lp_bal_test[0] = True
         elif lp_bal > 0:
             lp_bal_test[1] = True
 
-        squid_squill_bal = census.squill_lp_balance(voter)
+        squid_squill_bal = memo_census.squill_lp_balance(voter)
         if squid_squill_bal == 0:
             pro_quo_bal[0] = True
         else:
@@ -105,17 +104,17 @@ def test_voter_has_balance(voter_addresses, squid, census):
     assert pro_quo_bal == [True, True]
 
 
-def test_census_returns_balance(voter_addresses, census, zero_address):
+def test_census_returns_balance(voter_addresses, memo_census, zero_address):
     for voter in voter_addresses:
-        bal = census.balanceOf(voter)
+        bal = memo_census.balanceOf(voter)
         if voter == zero_address:
             assert bal == 0
         else:
             assert bal > 0
 
 
-def test_eth_price(census):
-    eth_price = census.eth_price() / 10**18
+def test_eth_price(baseline_prices):
+    eth_price = baseline_prices["eth"] / 10**18
     coingecko_eth_price = get_coingecko_price("ethereum")
 
     assert coingecko_eth_price is not None, "Failed to fetch ETH price from CoinGecko"
@@ -127,8 +126,8 @@ def test_eth_price(census):
     ), f"ETH price variance too high: contract={eth_price}, coingecko={coingecko_eth_price}, variance={price_variance:.2%}"
 
 
-def test_squid_price(census):
-    squid_price = census.squid_price() / 10**18
+def test_squid_price(baseline_prices):
+    squid_price = baseline_prices["squid"] / 10**18
     coingecko_squid_price = get_coingecko_price("leviathan-points")
 
     assert (
@@ -142,8 +141,8 @@ def test_squid_price(census):
     ), f"SQUID price variance too high: contract={squid_price}, coingecko={coingecko_squid_price}, variance={price_variance:.2%}"
 
 
-def test_squill_price(census):
-    squill_price = census.squill_price() / 10**18
+def test_squill_price(baseline_prices):
+    squill_price = baseline_prices["squill"] / 10**18
     coingecko_squill_price = get_coingecko_price("squill")
 
     assert (
@@ -157,13 +156,13 @@ def test_squill_price(census):
     ), f"SQUILL price variance too high: contract={squill_price}, coingecko={coingecko_squill_price}, variance={price_variance:.2%}"
 
 
-def test_squid_lp_equiv(census):
+def test_squid_lp_equiv(baseline_lp_rates):
     """
     Test SQUID LP equivalency using cached CoinGecko prices.
     SQUID_LP pool: 50% SQUID + 50% ETH (by USD value)
     Each LP token should contain approximately 1513 SQUID tokens + equivalent ETH.
     """
-    squid_val = census.squid_lp_equivalent() / 10**18
+    squid_val = baseline_lp_rates["squid"] / 10**18
     cached_prices = get_cached_prices()
 
     assert cached_prices is not None, "Failed to fetch cached prices"
@@ -202,13 +201,13 @@ def test_squid_lp_equiv(census):
     print(f"  ETH tokens: {eth_portion_value / eth_price_usd:.6f} ETH")
 
 
-def test_squill_lp_equiv(census):
+def test_squill_lp_equiv(baseline_lp_rates):
     """
     Test SQUILL LP equivalency using cached CoinGecko prices.
     SQUILL_LP pool: 50% SQUILL + 50% ETH (by USD value)
     Each LP token should contain approximately 12.63 SQUILL tokens + equivalent ETH.
     """
-    squill_val = census.squill_lp_equivalent() / 10**18
+    squill_val = baseline_lp_rates["squill"] / 10**18
     cached_prices = get_cached_prices()
 
     assert cached_prices is not None, "Failed to fetch cached prices"
@@ -1,4 +1,3 @@
-import boa
 import pytest
 
 pytestmark = pytest.mark.fork_only
@@ -20,7 +19,7 @@ def test_lp_equivalent_zero_quantity(census):
     ), "SQUILL LP equivalent should be 0 for zero quantity"
 
 
-def test_lp_equivalent_single_wei_dust_attack_check(census):
+def test_lp_equivalent_single_wei_dust_attack_check(census, baseline_lp_rates):
     """
     🚨 CRITICAL SECURITY TEST: Check for dust-based inflation attacks.
 
@@ -37,8 +36,8 @@ def test_lp_equivalent_single_wei_dust_attack_check(census):
     This means someone with 1 wei of SQUILL LP would get credited with 5.16 million SQUID
     worth of voting power! This is a SERIOUS issue if users can acquire dust amounts.
     """
-    squid_lp_standard = census.squid_lp_equivalent(10**18)
-    squill_lp_standard = census.squill_lp_equivalent(10**18)
+    squid_lp_standard = baseline_lp_rates["squid"]
+    squill_lp_standard = baseline_lp_rates["squill"]
 
     print("\n" + "=" * 80)
     print("🚨 DUST ATTACK VULNERABILITY TEST")
@@ -92,7 +91,7 @@ def test_lp_equivalent_single_wei_dust_attack_check(census):
     print("\n" + "=" * 80)
 
 
-def test_lp_equivalent_dust_amounts(census):
+def test_lp_equivalent_dust_amounts(census, baseline_lp_rates):
     """
     Test LP equivalent calculations with various dust amounts (very small quantities).
     Tests the minimum viable LP amount that doesn't revert.
@@ -108,8 +107,8 @@ def test_lp_equivalent_dust_amounts(census):
     ]
 
     # Get the standard 1 LP token equivalent rate for comparison
-    squid_lp_equiv_standard = census.squid_lp_equivalent(10**18)
-    squill_lp_equiv_standard = census.squill_lp_equivalent(10**18)
+    squid_lp_equiv_standard = baseline_lp_rates["squid"]
+    squill_lp_equiv_standard = baseline_lp_rates["squill"]
 
     print(f"\nStandard rates (per 1 LP token):")
     print(f"  SQUID/ETH LP: {squid_lp_equiv_standard / 10**18:.4f} SQUID per LP")
@@ -143,7 +142,7 @@ def test_lp_equivalent_dust_amounts(census):
             print(f"Dust amount: {dust} wei - SQUILL LP REVERTED (Curve protection)")
 
 
-def test_lp_equivalent_rate_consistency(census):
+def test_lp_equivalent_rate_consistency(census, baseline_lp_rates):
     """
     CRITICAL TEST: The lp_equivalent functions return a RATE (SQUID per LP token), not a total.
     The formula is: retval = _out * 10**18 // quantity
@@ -151,11 +150,9 @@ def test_lp_equivalent_rate_consistency(census):
 
     Test that this rate remains consistent regardless of the quantity queried.
     """
-    base_quantity = 10**18  # 1 LP token
-
-    # Get base rate (SQUID per LP token)
-    squid_lp_rate = census.squid_lp_equivalent(base_quantity)
-    squill_lp_rate = census.squill_lp_equivalent(base_quantity)
+    # Get base rate (SQUID per 1 LP token)
+    squid_lp_rate = baseline_lp_rates["squid"]
+    squill_lp_rate = baseline_lp_rates["squill"]
 
     print(f"\n=== Rate Consistency Test ===")
     print(f"Base rate (1 LP token):")
@@ -190,7 +187,7 @@ def test_lp_equivalent_rate_consistency(census):
         )
 
 
-def test_lp_equivalent_minimum_viable_amount(census):
+def test_lp_equivalent_minimum_viable_amount(census, baseline_lp_rates):
     """
     Test to find the minimum LP amount that doesn't revert.
     This helps understand the dust protection threshold.
@@ -205,8 +202,8 @@ def test_lp_equivalent_minimum_viable_amount(census):
         10**18,  # 1 token
     ]
 
-    squid_lp_standard_rate = census.squid_lp_equivalent(10**18)
-    squill_lp_standard_rate = census.squill_lp_equivalent(10**18)
+    squid_lp_standard_rate = baseline_lp_rates["squid"]
+    squill_lp_standard_rate = baseline_lp_rates["squill"]
 
     print(f"\n=== Minimum Viable Amount Test ===")
     print(
@@ -261,7 +258,7 @@ def test_lp_equivalent_minimum_viable_amount(census):
                 )
 
 
-def test_lp_balance_calculation_with_dust(census, voter_addresses, zero_address):
+def test_lp_balance_calculation_with_dust(memo_census, voter_addresses, zero_address):
     """
     Test that when a user has dust LP amounts, their balance calculation doesn't overflow
     or produce unexpected results.
@@ -275,16 +272,16 @@ def test_lp_balance_calculation_with_dust(census, voter_addresses, zero_address)
             continue
 
         # Get LP balances
-        squid_lp_bal = census.squid_lp_balance(voter)
-        squill_lp_bal = census.squill_lp_balance(voter)
+        squid_lp_bal = memo_census.squid_lp_balance(voter)
+        squill_lp_bal = memo_census.squill_lp_balance(voter)
 
         # Get calculated SQUID equivalents
-        squid_lp_in_squid = census.squid_lp_balance_in_squid(voter)
-        squill_lp_in_squid = census.squill_lp_balance_in_squid(voter)
+        squid_lp_in_squid = memo_census.squid_lp_balance_in_squid(voter)
+        squill_lp_in_squid = memo_census.squill_lp_balance_in_squid(voter)
 
         # Get rates
         if squid_lp_bal > 0:
-            squid_rate = census.squid_lp_equivalent(squid_lp_bal)
+            squid_rate = memo_census.squid_lp_equivalent(squid_lp_bal)
             # Manual calculation: bal * rate // 10**18
             expected_squid = squid_lp_bal * squid_rate // 10**18
 
@@ -301,7 +298,7 @@ def test_lp_balance_calculation_with_dust(census, voter_addresses, zero_address)
             ), f"SQUID LP equivalent seems unreasonably large for voter {voter}: {squid_lp_in_squid}"
 
         if squill_lp_bal > 0:
-            squill_rate = census.squill_lp_equivalent(squill_lp_bal)
+            squill_rate = memo_census.squill_lp_equivalent(squill_lp_bal)
             expected_squill = squill_lp_bal * squill_rate // 10**18
 
             assert (
@@ -388,13 +385,13 @@ def test_lp_equivalent_consistency_across_calls(census):
     ), f"SQUILL LP equivalent should be consistent: {squill_results}"
 
 
-def test_lp_equivalent_rate_reasonableness(census):
+def test_lp_equivalent_rate_reasonableness(baseline_lp_rates):
     """
     Test that the LP equivalent rates are reasonable compared to standard LP token economics.
     For a 50/50 LP pool, 1 LP token should be worth roughly 2x one side of the pool.
     """
-    squid_lp_rate = census.squid_lp_equivalent(10**18)
-    squill_lp_rate = census.squill_lp_equivalent(10**18)
+    squid_lp_rate = baseline_lp_rates["squid"]
+    squill_lp_rate = baseline_lp_rates["squill"]
 
     # Rates should be positive
     assert squid_lp_rate > 0, "SQUID LP rate should be positive"